@@ -1,8 +1,10 @@
 import logging
 import ray
+import threading
 import time
+from concurrent.futures import Future
 from itertools import count
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,9 @@ class UpdatableLLMEngine:
         dtype: str = "auto",
         max_model_len: Optional[int] = None,
         gpu_memory_utilization: float = 0.90,
+        enforce_eager: bool = False,
+        max_num_seqs: Optional[int] = None,
+        max_num_batched_tokens: Optional[int] = None,
     ):
         if not VLLM_AVAILABLE:
             raise ImportError(
@@ -39,8 +44,17 @@ class UpdatableLLMEngine:
         self.dtype = dtype
         self.max_model_len = max_model_len
         self.gpu_memory_utilization = gpu_memory_utilization
+        self.enforce_eager = enforce_eager
 
-        logger.info(f"Initializing vLLM engine with model: {model_name}")
+        logger.info("Initializing vLLM engine with model: %s", model_name)
+
+        # scheduler limits are only overridden when given, keeping vLLM's
+        # defaults otherwise
+        scheduler_args = {}
+        if max_num_seqs is not None:
+            scheduler_args["max_num_seqs"] = max_num_seqs
+        if max_num_batched_tokens is not None:
+            scheduler_args["max_num_batched_tokens"] = max_num_batched_tokens
 
         engine_args = EngineArgs(
             model=model_name,
@@ -48,40 +62,134 @@ class UpdatableLLMEngine:
             dtype=dtype,
             max_model_len=max_model_len,
             gpu_memory_utilization=gpu_memory_utilization,
-            enforce_eager=False,
+            enforce_eager=enforce_eager,
             disable_log_stats=False,
+            **scheduler_args,
         )
 
         self.engine = LLMEngine.from_engine_args(engine_args)
         self.request_counter = count()
 
-        logger.info("vLLM engine initialized successfully")
-
-    def add_request(self, prompt: str, sampling_params_dict: Dict[str, Any]) -> str:
-        request_id = str(next(self.request_counter))
-
-        sampling_params = SamplingParams(**sampling_params_dict)
-
-        self.engine.add_request(request_id, prompt, sampling_params)
-        return request_id
+        # Requests submitted through `generate` are driven to completion by a
+        # single background step loop, which resolves each request's future
+        # once its output is finished.
+        self._engine_lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._work_available = threading.Event()
+        self._step_thread: Optional[threading.Thread] = None
+        self._running = True
 
-    def step(self) -> List[RequestOutput]:
-        if self.engine.has_unfinished_requests():
-            request_outputs = self.engine.step()
-            return request_outputs
-        return []
+        logger.info("vLLM engine initialized successfully")
 
     def has_unfinished_requests(self) -> bool:
-        return self.engine.has_unfinished_requests()
+        with self._engine_lock:
+            return self.engine.has_unfinished_requests()
 
+    # Abort a request submitted through `generate`; its caller is woken with
+    # a CancelledError.
     def abort_request(self, request_id: str):
-        self.engine.abort_request(request_id)
+        with self._engine_lock:
+            self.engine.abort_request([request_id])
+            future = self._pending.pop(request_id, None)
+        if future is not None:
+            future.cancel()
+
+    # Submit a request and block until its final output is available.
+    # All stepping is done by one background loop, so concurrent callers are
+    # batched together by the engine instead of each caller polling it.
+    def generate(
+        self,
+        prompt: str,
+        sampling_params_dict: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> RequestOutput:
+        request_id = str(next(self.request_counter))
+        sampling_params = SamplingParams(**sampling_params_dict)
+        future: Future = Future()
+
+        with self._engine_lock:
+            if not self._running:
+                raise RuntimeError("Engine has been shut down")
+            self._pending[request_id] = future
+            try:
+                self.engine.add_request(request_id, prompt, sampling_params)
+            except BaseException:
+                del self._pending[request_id]
+                raise
+        self._ensure_step_loop()
+        self._work_available.set()
+
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            self.abort_request(request_id)
+            raise
+
+    def _ensure_step_loop(self):
+        if self._step_thread is not None:
+            return
+        with self._engine_lock:
+            if self._step_thread is None and self._running:
+                step_thread = threading.Thread(
+                    target=self._step_loop, name="vllm-step-loop", daemon=True
+                )
+                step_thread.start()
+                self._step_thread = step_thread
+
+    # Fail every pending request and remove it from the engine, so no orphaned
+    # requests are left behind. Must be called with `_engine_lock` held.
+    def _fail_pending(self, error: BaseException):
+        if not self._pending:
+            return
+        try:
+            self.engine.abort_request(list(self._pending))
+        except Exception as e:
+            logger.warning("Failed to abort pending requests: %s", e)
+        for future in self._pending.values():
+            future.set_exception(error)
+        self._pending.clear()
+
+    def _step_loop(self):
+        while self._running:
+            self._work_available.wait()
+            with self._engine_lock:
+                if not self._pending:
+                    # cleared under the lock, so a request added after this
+                    # point always sets the event again
+                    self._work_available.clear()
+                    continue
+                try:
+                    request_outputs = self.engine.step()
+                except Exception as e:
+                    logger.error("vLLM engine step failed: %s", e)
+                    self._fail_pending(e)
+                    continue
+                finished = [
+                    (self._pending.pop(output.request_id, None), output)
+                    for output in request_outputs
+                    if output.finished
+                ]
+            for future, output in finished:
+                if future is not None:
+                    future.set_result(output)
+
+    def _stop_step_loop(self):
+        with self._engine_lock:
+            self._running = False
+            step_thread, self._step_thread = self._step_thread, None
+        self._work_available.set()
+        if step_thread is not None:
+            step_thread.join()
+        with self._engine_lock:
+            self._fail_pending(RuntimeError("Engine has been shut down"))
 
     def get_tokenizer(self):
         return self.engine.tokenizer
 
     def shutdown(self):
         logger.info("Shutting down vLLM engine")
+        self._stop_step_loop()
+
         # vLLM handles cleanup automatically when the engine is destroyed
         if self.engine is not None:
             del self.engine
@@ -92,7 +200,7 @@ class UpdatableLLMEngine:
                 ray.shutdown()
                 logger.info("Ray shutdown complete")
         except Exception as e:
-            logger.warning(f"Failed to shutdown Ray: {e}")
+            logger.warning("Failed to shutdown Ray: %s", e)
 
         # Give time to clean up
         time.sleep(1)
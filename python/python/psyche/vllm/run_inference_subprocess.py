@@ -1,15 +1,12 @@
 import os
 import json
 import sys
-from pathlib import Path
 import multiprocessing
 
 os.environ["VLLM_LOGGING_LEVEL"] = "ERROR"
 
 multiprocessing.set_start_method("spawn", force=True)
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 
 def run_inference(model_name: str, prompt: str) -> str:
     from psyche.vllm.engine import UpdatableLLMEngine
@@ -18,6 +15,7 @@ def run_inference(model_name: str, prompt: str) -> str:
     original_stderr = sys.stderr
 
     generated_text = ""
+    engine = None
 
     with open(os.devnull, "w") as devnull:
         sys.stdout = devnull
@@ -29,6 +27,10 @@ def run_inference(model_name: str, prompt: str) -> str:
                 tensor_parallel_size=1,
                 max_model_len=512,
                 gpu_memory_utilization=0.3,
+                # a single short generation doesn't pay back CUDA graph capture
+                # or scheduler slots for concurrent sequences
+                enforce_eager=True,
+                max_num_seqs=1,
             )
 
             sampling_params = {
@@ -36,17 +38,15 @@ def run_inference(model_name: str, prompt: str) -> str:
                 "max_tokens": 20,
             }
 
-            request_id = engine.add_request(prompt, sampling_params)
-            outputs = []
-            while engine.has_unfinished_requests():
-                outputs.extend(engine.step())
+            final_output = engine.generate(prompt, sampling_params)
 
-            if outputs[0] and outputs[0].outputs[0]:
-                generated_text = outputs[0].outputs[0].text
+            if final_output.outputs:
+                generated_text = final_output.outputs[0].text
         finally:
             sys.stdout = original_stdout
             sys.stderr = original_stderr
-            engine.shutdown()
+            if engine is not None:
+                engine.shutdown()
 
     return generated_text
 
@@ -54,7 +54,7 @@ def run_inference(model_name: str, prompt: str) -> str:
 if __name__ == "__main__":
     if len(sys.argv) != 3:
         print(
-            "Usage: python run_inference_subprocess.py <model> <prompt>",
+            "Usage: python -m psyche.vllm.run_inference_subprocess <model> <prompt>",
             file=sys.stderr,
         )
         sys.exit(1)
@@ -0,0 +1,145 @@
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+import psyche.vllm.engine as engine_module
+from psyche.vllm.engine import UpdatableLLMEngine
+
+NEVER_FINISHES = 1 << 30
+
+
+# Minimal stand-in for vLLM's LLMEngine: every step emits one token for each
+# unfinished request and finishes a request once it reaches max_tokens.
+class StubLLMEngine:
+    def __init__(self):
+        self.requests = {}
+        self.max_batch_size = 0
+        self.fail_next_step = False
+        self.tokenizer = None
+
+    @classmethod
+    def from_engine_args(cls, engine_args):
+        return cls()
+
+    def add_request(self, request_id, prompt, sampling_params):
+        self.requests[request_id] = [prompt, "", sampling_params.max_tokens]
+
+    # vLLM V1 takes a list of ids and iterates it, so a bare id string would
+    # abort one request per character
+    def abort_request(self, request_ids):
+        assert not isinstance(request_ids, str), "abort_request takes a list"
+        for request_id in request_ids:
+            self.requests.pop(request_id, None)
+
+    def has_unfinished_requests(self):
+        return bool(self.requests)
+
+    def step(self):
+        # slow enough that concurrent submitters land in the same batch
+        time.sleep(0.005)
+        self.max_batch_size = max(self.max_batch_size, len(self.requests))
+        if self.fail_next_step:
+            self.fail_next_step = False
+            raise RuntimeError("step failed")
+        outputs = []
+        for request_id, request in list(self.requests.items()):
+            request[1] += "x"
+            finished = len(request[1]) >= request[2]
+            if finished:
+                del self.requests[request_id]
+            outputs.append(
+                SimpleNamespace(
+                    request_id=request_id,
+                    prompt=request[0],
+                    outputs=[SimpleNamespace(text=request[1])],
+                    finished=finished,
+                )
+            )
+        return outputs
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(engine_module, "VLLM_AVAILABLE", True)
+    monkeypatch.setattr(engine_module, "LLMEngine", StubLLMEngine)
+    monkeypatch.setattr(engine_module, "EngineArgs", dict)
+    monkeypatch.setattr(
+        engine_module,
+        "SamplingParams",
+        lambda max_tokens=16, **kwargs: SimpleNamespace(max_tokens=max_tokens),
+    )
+    monkeypatch.setattr(engine_module, "time", SimpleNamespace(sleep=lambda _: None))
+    eng = UpdatableLLMEngine("stub")
+    yield eng
+    if eng._running:
+        eng.shutdown()
+
+
+def test_generate_batches_concurrent_requests(engine):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(
+                lambda i: engine.generate(f"prompt {i}", {"max_tokens": 4}),
+                range(8),
+            )
+        )
+
+    assert [r.prompt for r in results] == [f"prompt {i}" for i in range(8)]
+    assert all(r.outputs[0].text == "xxxx" for r in results)
+    # requests submitted together share steps instead of running back to back
+    assert engine.engine.max_batch_size > 1
+    assert not engine.has_unfinished_requests()
+
+
+def wait_for_pending_request(engine):
+    while not engine._pending:
+        time.sleep(0.001)
+    return next(iter(engine._pending))
+
+
+def test_generate_timeout_aborts_request(engine):
+    with pytest.raises(TimeoutError):
+        engine.generate("prompt", {"max_tokens": NEVER_FINISHES}, timeout=0.05)
+
+    assert not engine._pending
+    assert not engine.has_unfinished_requests()
+
+
+def test_abort_request_cancels_generate(engine):
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        result = pool.submit(engine.generate, "prompt", {"max_tokens": NEVER_FINISHES})
+        engine.abort_request(wait_for_pending_request(engine))
+
+        with pytest.raises(CancelledError):
+            result.result(timeout=5)
+
+    assert not engine.has_unfinished_requests()
+
+
+def test_failed_step_fails_and_aborts_pending_requests(engine):
+    engine.engine.fail_next_step = True
+
+    with pytest.raises(RuntimeError, match="step failed"):
+        engine.generate("prompt", {"max_tokens": 4}, timeout=5)
+
+    assert not engine._pending
+    assert not engine.has_unfinished_requests()
+    # the step loop keeps serving new requests after a failure
+    assert engine.generate("prompt", {"max_tokens": 2}, timeout=5).finished
+
+
+def test_shutdown_fails_pending_requests(engine):
+    stub = engine.engine
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        result = pool.submit(engine.generate, "prompt", {"max_tokens": NEVER_FINISHES})
+        wait_for_pending_request(engine)
+        engine.shutdown()
+
+        with pytest.raises(RuntimeError, match="shut down"):
+            result.result(timeout=5)
+
+    assert not stub.requests
+    with pytest.raises(RuntimeError, match="shut down"):
+        engine.generate("prompt", {"max_tokens": 4})
@@ -45,7 +45,7 @@ impl InferenceNode {
         );
 
         Python::with_gil(|py| {
-            let result = vllm::create_engine(
+            vllm::create_engine(
                 py,
                 &self.engine_id,
                 &self.model_name,
@@ -53,15 +53,12 @@ impl InferenceNode {
                 Some("auto"),
                 None, // max_model_len
                 gpu_memory_utilization,
+                None, // enforce_eager
+                None, // max_num_seqs
             )
+            .map_err(|err| anyhow::Error::msg(vllm::format_py_err(py, &err)))
             .context("Failed to create vLLM engine")?;
 
-            // Check status
-            if !result.success {
-                let error = result.error.unwrap_or_else(|| "Unknown error".to_string());
-                return Err(anyhow!("Engine creation failed: {}", error));
-            }
-
             info!("vLLM engine initialized successfully: {}", self.engine_id);
             self.initialized = true;
             Ok(())
@@ -89,22 +86,11 @@ impl InferenceNode {
                 Some(request.top_p),
                 Some(request.max_tokens as i32),
             )
+            .map_err(|err| anyhow::Error::msg(vllm::format_py_err(py, &err)))
             .context("Failed to run inference")?;
 
-            // Check status
-            if !result.success {
-                let error = result.error.unwrap_or_else(|| "Unknown error".to_string());
-                return Err(anyhow!("Inference failed: {}", error));
-            }
-
-            // Extract generated text
-            let generated_text = result
-                .generated_text
-                .ok_or_else(|| anyhow!("Missing generated_text in response"))?;
-
-            let full_text = result
-                .full_text
-                .ok_or_else(|| anyhow!("Missing full_text in response"))?;
+            let generated_text = result.generated_text;
+            let full_text = result.full_text;
 
             debug!(
                 "Inference completed for request: {}, generated {} chars",
@@ -130,7 +116,9 @@ impl InferenceNode {
         info!("Shutting down inference node: {}", self.engine_id);
 
         Python::with_gil(|py| {
-            vllm::shutdown_engine(py, &self.engine_id).context("Failed to shutdown engine")?;
+            vllm::shutdown_engine(py, &self.engine_id)
+                .map_err(|err| anyhow::Error::msg(vllm::format_py_err(py, &err)))
+                .context("Failed to shutdown engine")?;
             self.initialized = false; // Mark as shutdown to prevent double-shutdown
             Ok(())
         })
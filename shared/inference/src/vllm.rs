@@ -17,82 +17,59 @@
 //! - `get_engine_stats()` - Get engine statistics
 //! - `list_engines()` - List all registered engines
 //! - `shutdown_engine()` - Shutdown and cleanup an engine
+//!
+//! The Python bridge returns plain values on success and raises on failure.
+//! A raised exception is returned unchanged as the `Err` of each function;
+//! use `format_py_err()` to render it together with its Python traceback.
 
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
-use std::collections::HashMap;
 
 /// Response from engine creation
 #[derive(Debug, Clone)]
 pub struct EngineCreationResult {
-    pub success: bool,
-    pub engine_id: Option<String>,
-    pub error: Option<String>,
+    pub engine_id: String,
 }
 
 /// Response from inference request
 #[derive(Debug, Clone)]
 pub struct InferenceResult {
-    pub success: bool,
-    pub request_id: Option<String>,
-    pub generated_text: Option<String>,
-    pub full_text: Option<String>,
-    pub error: Option<String>,
+    pub request_id: String,
+    pub generated_text: String,
+    pub full_text: String,
 }
 
 /// Response from engine shutdown
 #[derive(Debug, Clone)]
 pub struct ShutdownResult {
-    pub success: bool,
-    pub engine_id: Option<String>,
-    pub error: Option<String>,
+    pub engine_id: String,
 }
 
 /// Response from engine stats request
 #[derive(Debug, Clone)]
 pub struct EngineStats {
-    pub success: bool,
-    pub engine_id: Option<String>,
-    pub model_name: Option<String>,
-    pub tensor_parallel_size: Option<i64>,
-    pub has_unfinished_requests: Option<bool>,
-    pub error: Option<String>,
+    pub engine_id: String,
+    pub model_name: String,
+    pub tensor_parallel_size: i64,
+    pub has_unfinished_requests: bool,
 }
 
 /// Response from list engines request
 #[derive(Debug, Clone)]
 pub struct EngineList {
-    pub success: bool,
     pub engine_ids: Vec<String>,
-    pub error: Option<String>,
 }
 
-/// Helper function to convert Python dict to Rust HashMap
-fn py_dict_to_hashmap(dict: &Bound<'_, PyDict>) -> PyResult<HashMap<String, PyObject>> {
-    let mut map = HashMap::new();
-    for (key, value) in dict.iter() {
-        let key_str: String = key.extract()?;
-        map.insert(key_str, value.unbind());
+/// Render a Python exception with its traceback, if it has one
+pub fn format_py_err(py: Python, err: &PyErr) -> String {
+    match err.traceback(py).and_then(|tb| tb.format().ok()) {
+        Some(traceback) => format!("{traceback}{err}"),
+        None => err.to_string(),
     }
-    Ok(map)
-}
-
-/// Helper to extract optional string from HashMap
-fn get_optional_string(map: &HashMap<String, PyObject>, key: &str, py: Python) -> Option<String> {
-    map.get(key).and_then(|v| v.extract(py).ok())
-}
-
-/// Helper to extract optional i64 from HashMap
-fn get_optional_i64(map: &HashMap<String, PyObject>, key: &str, py: Python) -> Option<i64> {
-    map.get(key).and_then(|v| v.extract(py).ok())
-}
-
-/// Helper to extract optional bool from HashMap
-fn get_optional_bool(map: &HashMap<String, PyObject>, key: &str, py: Python) -> Option<bool> {
-    map.get(key).and_then(|v| v.extract(py).ok())
 }
 
 /// Create a new vLLM engine
+#[allow(clippy::too_many_arguments)]
 pub fn create_engine(
     py: Python,
     engine_id: &str,
@@ -101,6 +78,8 @@ pub fn create_engine(
     dtype: Option<&str>,
     max_model_len: Option<i32>,
     gpu_memory_utilization: Option<f64>,
+    enforce_eager: Option<bool>,
+    max_num_seqs: Option<i32>,
 ) -> PyResult<EngineCreationResult> {
     let rust_bridge = py.import("psyche.vllm.rust_bridge")?;
 
@@ -124,17 +103,18 @@ pub fn create_engine(
         kwargs.set_item("gpu_memory_utilization", gmu)?;
     }
 
-    let result = rust_bridge.call_method("create_engine", (), Some(&kwargs))?;
-    let dict = result.downcast::<PyDict>()?;
-    let map = py_dict_to_hashmap(dict)?;
+    if let Some(eager) = enforce_eager {
+        kwargs.set_item("enforce_eager", eager)?;
+    }
 
-    let status = get_optional_string(&map, "status", py).unwrap_or_default();
-    let success = status == "success";
+    if let Some(mns) = max_num_seqs {
+        kwargs.set_item("max_num_seqs", mns)?;
+    }
+
+    let result = rust_bridge.call_method("create_engine", (), Some(&kwargs))?;
 
     Ok(EngineCreationResult {
-        success,
-        engine_id: get_optional_string(&map, "engine_id", py),
-        error: get_optional_string(&map, "error", py),
+        engine_id: result.extract()?,
     })
 }
 
@@ -174,18 +154,11 @@ pub fn run_inference(
     }
 
     let result = rust_bridge.call_method("run_inference", (), Some(&kwargs))?;
-    let dict = result.downcast::<PyDict>()?;
-    let map = py_dict_to_hashmap(dict)?;
-
-    let status = get_optional_string(&map, "status", py).unwrap_or_default();
-    let success = status == "success";
 
     Ok(InferenceResult {
-        success,
-        request_id: get_optional_string(&map, "request_id", py),
-        generated_text: get_optional_string(&map, "generated_text", py),
-        full_text: get_optional_string(&map, "full_text", py),
-        error: get_optional_string(&map, "error", py),
+        request_id: result.getattr("request_id")?.extract()?,
+        generated_text: result.getattr("generated_text")?.extract()?,
+        full_text: result.getattr("full_text")?.extract()?,
     })
 }
 
@@ -194,16 +167,9 @@ pub fn shutdown_engine(py: Python, engine_id: &str) -> PyResult<ShutdownResult>
     let rust_bridge = py.import("psyche.vllm.rust_bridge")?;
 
     let result = rust_bridge.call_method1("shutdown_engine", (engine_id,))?;
-    let dict = result.downcast::<PyDict>()?;
-    let map = py_dict_to_hashmap(dict)?;
-
-    let status = get_optional_string(&map, "status", py).unwrap_or_default();
-    let success = status == "success";
 
     Ok(ShutdownResult {
-        success,
-        engine_id: get_optional_string(&map, "engine_id", py),
-        error: get_optional_string(&map, "error", py),
+        engine_id: result.extract()?,
     })
 }
 
@@ -212,19 +178,12 @@ pub fn get_engine_stats(py: Python, engine_id: &str) -> PyResult<EngineStats> {
     let rust_bridge = py.import("psyche.vllm.rust_bridge")?;
 
     let result = rust_bridge.call_method1("get_engine_stats", (engine_id,))?;
-    let dict = result.downcast::<PyDict>()?;
-    let map = py_dict_to_hashmap(dict)?;
-
-    let status = get_optional_string(&map, "status", py).unwrap_or_default();
-    let success = status == "success";
 
     Ok(EngineStats {
-        success,
-        engine_id: get_optional_string(&map, "engine_id", py),
-        model_name: get_optional_string(&map, "model_name", py),
-        tensor_parallel_size: get_optional_i64(&map, "tensor_parallel_size", py),
-        has_unfinished_requests: get_optional_bool(&map, "has_unfinished_requests", py),
-        error: get_optional_string(&map, "error", py),
+        engine_id: result.getattr("engine_id")?.extract()?,
+        model_name: result.getattr("model_name")?.extract()?,
+        tensor_parallel_size: result.getattr("tensor_parallel_size")?.extract()?,
+        has_unfinished_requests: result.getattr("has_unfinished_requests")?.extract()?,
     })
 }
 
@@ -233,21 +192,9 @@ pub fn list_engines(py: Python) -> PyResult<EngineList> {
     let rust_bridge = py.import("psyche.vllm.rust_bridge")?;
 
     let result = rust_bridge.call_method0("list_engines")?;
-    let dict = result.downcast::<PyDict>()?;
-    let map = py_dict_to_hashmap(dict)?;
-
-    let status = get_optional_string(&map, "status", py).unwrap_or_default();
-    let success = status == "success";
-
-    let engine_ids = map
-        .get("engine_ids")
-        .and_then(|v| v.extract::<Vec<String>>(py).ok())
-        .unwrap_or_default();
 
     Ok(EngineList {
-        success,
-        engine_ids,
-        error: get_optional_string(&map, "error", py),
+        engine_ids: result.extract()?,
     })
 }
 
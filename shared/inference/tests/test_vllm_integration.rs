@@ -24,6 +24,8 @@ fn test_create_and_shutdown_engine() {
             Some("auto"), // dtype
             Some(512),    // max_model_len
             Some(0.3),    // gpu_memory_utilization
+            Some(true),   // enforce_eager: skip CUDA graph capture in tests
+            Some(1),      // max_num_seqs: tests only run one request at a time
         );
 
         assert!(
@@ -33,12 +35,7 @@ fn test_create_and_shutdown_engine() {
         );
 
         let response = result.unwrap();
-        assert!(
-            response.success,
-            "Engine creation failed: {:?}",
-            response.error
-        );
-        assert_eq!(response.engine_id.as_deref(), Some("test_engine"));
+        assert_eq!(response.engine_id, "test_engine");
 
         // Shutdown engine
         let result = vllm::shutdown_engine(py, "test_engine");
@@ -59,13 +56,6 @@ fn test_list_engines() {
     Python::with_gil(|py| {
         let result = vllm::list_engines(py);
         assert!(result.is_ok(), "Failed to list engines: {:?}", result.err());
-
-        let response = result.unwrap();
-        assert!(
-            response.success,
-            "List engines failed: {:?}",
-            response.error
-        );
     });
 }
 
@@ -94,6 +84,8 @@ fn test_run_inference() {
             Some("auto"),
             Some(512),
             Some(0.3),
+            Some(true),
+            Some(1),
         );
 
         if result.is_err() {
@@ -114,9 +106,8 @@ fn test_run_inference() {
         assert!(result.is_ok(), "Inference failed: {:?}", result.err());
 
         let response = result.unwrap();
-        assert!(response.success, "Inference failed: {:?}", response.error);
         assert!(
-            response.generated_text.is_some(),
+            !response.generated_text.is_empty(),
             "No generated text returned"
         );
 